@@ -0,0 +1,9 @@
+# cython: language_level=3
+from libc.math cimport sin, cos, M_PI
+
+
+cpdef (double, double) step_move(double x, double y, double bearing_deg, int sign, double dist):
+    """Move (x, y) dist centimeters along bearing_deg, or against it if sign is -1"""
+    cdef double rads = bearing_deg * M_PI / 180.0
+    cdef double d = sign * dist
+    return x + sin(rads) * d, y + cos(rads) * d
@@ -1,66 +1,199 @@
+import collections
+import functools
 import json
+import math
+import os
+import sys
 import time
 from matplotlib import pyplot as plt
 from matplotlib.ticker import FuncFormatter, MaxNLocator
 import numpy as np
-import pandas as pd
 
 from easytello import Tello
 
+try:
+    import orjson
+except ImportError:
+    # Saving and loading fall back to the standard library json module
+    orjson = None
+
+_FLIP_DIRS = frozenset({"f", "b", "r", "l"})
+
+
+# Bearings only change on cw/ccw, so consecutive moves reuse the same
+# (sin, cos) pair
+@functools.lru_cache(maxsize=1024)
+def _heading_vector(bearing):
+    rads = math.radians(bearing)
+    return math.sin(rads), math.cos(rads)
+
+
+def _py_step_move(x, y, bearing_deg, sign, dist):
+    sine, cosine = _heading_vector(bearing_deg)
+    return x + sine * sign * dist, y + cosine * sign * dist
+
+
+try:
+    # Prebuilt C step, e.g. from `cythonize -i tello_sim/_path_kernel.pyx`
+    from ._path_kernel import step_move
+except ImportError:
+    step_move = _py_step_move
+    if os.environ.get('TELLO_SIM_PYXIMPORT') == '1':
+        # Opt-in only: pyximport loads the Cython compiler on every import
+        try:
+            import pyximport
+            _importers = pyximport.install(language_level=3)
+            try:
+                from ._path_kernel import step_move
+            finally:
+                pyximport.uninstall(*_importers)
+        except ImportError:
+            pass
+
+
+# Command logs repeat the same few commands, e.g. "forward 100". Arguments
+# are passed unpacked so typed=True keeps 10, 10.0 and True apart.
+@functools.lru_cache(maxsize=1024, typed=True)
+def _serialize(command, *args):
+    if len(args) > 0:
+        return f"{command} {' '.join([str(arg) for arg in args])}"
+    return command
+
 
 class Simulator():
     def __init__(self):
         self.takeoff_alt = 81
+        self.smoothing_window = 5  # Number of points to average
         self._init_state()
         self.driver_instance = None
-        self.smoothing_window = 5  # Number of points to average
-
-        # Put drone into command mode
-        self.command()
+        # Set while replaying a command file so the flight is drawn only once
+        self._suppress_plot = False
+        # Pause after each simulated command so the output can be followed;
+        # only enabled with TELLO_SIM_REALTIME=1 so scripts run instantly
+        self._sim_delay = 2.0 if os.environ.get('TELLO_SIM_REALTIME') == '1' else 0
+        # While replaying, command output is buffered and the pause skipped
+        self._batch_mode = False
+        self._batch_output = []
+        self._alt_fig = None
+        self._horz_fig = None
+        self._interactive_shown = False
 
     def _init_state(self):
         self.takeoff_state = False
         self.altitude = 0
         self.cur_loc = (0,0)
         self.bearing = 0
-        self.altitude_data = []
-        self.path_coors = [(0,0)]
-        self.flip_coors = []
+        # Altitude samples live in a preallocated buffer grown by doubling
+        self._alt_arr = np.empty(64, dtype=np.int64)
+        self._alt_len = 0
+        self._reset_sma()
+        # Path and flip locations are kept as parallel x/y lists so they can
+        # be handed to matplotlib without repacking
+        self._px = [0.0]
+        self._py = [0.0]
+        self._xmin = self._xmax = 0.0
+        self._ymin = self._ymax = 0.0
+        self._flip_x = []
+        self._flip_y = []
+        # Which plotted series changed since the last realtime update
+        self._path_dirty = True
+        self._flip_dirty = True
+        self._alt_dirty = True
         self.fig_count = 1
-        self.command_log = []
+        # Append-only until saved or deployed
+        self.command_log = collections.deque()
+
+    @property
+    def path_coors(self):
+        return list(zip(self._px, self._py))
+
+    @property
+    def flip_coors(self):
+        return list(zip(self._flip_x, self._flip_y))
+
+    def _append_path(self, loc):
+        x, y = loc
+        self._px.append(x)
+        self._py.append(y)
+        self._path_dirty = True
+        # Running extrema keep the limit computation O(1) per step
+        if x < self._xmin:
+            self._xmin = x
+        elif x > self._xmax:
+            self._xmax = x
+        if y < self._ymin:
+            self._ymin = y
+        elif y > self._ymax:
+            self._ymax = y
+
+    @property
+    def altitude_data(self):
+        return self._alt_arr[:self._alt_len]
+
+    def _append_altitude(self, height):
+        if self._alt_len == len(self._alt_arr):
+            grown = np.empty(2 * len(self._alt_arr), dtype=self._alt_arr.dtype)
+            grown[:self._alt_len] = self._alt_arr
+            self._alt_arr = grown
+        self._alt_arr[self._alt_len] = height
+        self._alt_len += 1
+        self._alt_dirty = True
+        self._update_sma(height)
+
+    def _reset_sma(self):
+        # Running state of the centered moving average over altitude_data
+        self._sma_sum = 0.0
+        self._sma_window = collections.deque(maxlen=self.smoothing_window)
+        self._sma_out = []
+
+    def _update_sma(self, height):
+        window = self._sma_window
+        if len(window) == window.maxlen:
+            self._sma_sum -= window[0]
+        elif len(window) < window.maxlen // 2:
+            # The leading points have no full window centered on them
+            self._sma_out.append(float('nan'))
+        window.append(height)
+        self._sma_sum += height
+        if len(window) == window.maxlen:
+            self._sma_out.append(self._sma_sum / len(window))
 
     @staticmethod
     def serialize_command(command: dict):
-        serialized = command['command']
-        command_args = command.get('arguments', ())
-        if len(command_args) > 0:
-            serialized = '{} {}'.format(serialized, ' '.join([str(arg) for arg in command_args]))
-        return serialized
+        return _serialize(command['command'], *command.get('arguments', ()))
 
     @staticmethod
     def check_flip_param(param: str):
-        if param not in ["f", "b", "r", "l"]:
-            raise Exception("I can't tell which way to flip. Please use f, b, r, or l")
-        else:
-            pass
+        # Check the type first: unhashable values can't be looked up
+        if not isinstance(param, str) or param not in _FLIP_DIRS:
+            raise ValueError("I can't tell which way to flip. Please use f, b, r, or l")
 
     @staticmethod
     def check_int_param(param: int):
-        if type(param) != int:
-            raise Exception("One of the parameters of this command only accepts whole numbers without quotation marks.")
-        else:
-            pass
+        # bool is a subclass of int but is never a valid distance or angle
+        if not isinstance(param, int) or isinstance(param, bool):
+            raise TypeError("One of the parameters of this command only accepts whole numbers without quotation marks.")
 
     def send_command(self, command: str, *args):
-        # Command log allows for replaying commands to the actual drone
-        command_json = {
-            'command': command,
-            'arguments': args
-        }
-        self.command_log.append(command_json)
-        print('I am running your "{}" command.'.format(self.serialize_command(command_json)))
+        # Command log allows for replaying commands to the actual drone.
+        # Entries are (command, arguments) tuples so they can be cached
+        # by _serialize.
+        self.command_log.append((command, args))
+        self._log(f'I am running your "{_serialize(command, *args)}" command.')
+
+        if self._sim_delay and not self._batch_mode:
+            time.sleep(self._sim_delay)
+
+    def _log(self, message: str):
+        if self._batch_mode:
+            self._batch_output.append(message + '\n')
+        else:
+            print(message)
 
-        time.sleep(2)
+    def _flush_log(self):
+        sys.stdout.write(''.join(self._batch_output))
+        sys.stdout.flush()
+        self._batch_output = []
 
     # Control Commands
     def command(self):
@@ -71,91 +204,128 @@ class Simulator():
         if not self.takeoff_state:
             raise Exception("I can't do that unless I takeoff first!")
         else:
-            print("I am flying at {} centimeters above my takeoff altitude.".format(self.altitude))
+            self._log(f"I am flying at {self.altitude} centimeters above my takeoff altitude.")
             pass
 
     # Plotting functions
+    # The step plots reuse one figure each; they are only rebuilt if the
+    # user closed the window
+    def _get_altitude_axes(self):
+        if self._alt_fig is None or not plt.fignum_exists(self._alt_fig.number):
+            self._alt_fig, ax = plt.subplots()
+            ax.xaxis.set_major_locator(MaxNLocator(integer=True))
+            self._alt_moves, = ax.plot([], [], 'ro', linestyle='dashed', linewidth=2, markersize=12)
+            self._alt_error, = ax.plot([], [], alpha=.15)
+            ax.grid()
+            ax.set(xlabel='Step', ylabel='Altitude in Centimeters',title='Tello Altitude')
+            self._alt_ax = ax
+            self._interactive_shown = False
+        return self._alt_ax
+
+    def _get_horz_axes(self):
+        if self._horz_fig is None or not plt.fignum_exists(self._horz_fig.number):
+            self._horz_fig, ax = plt.subplots()
+            self._horz_moves, = ax.plot([], [], 'bo', linestyle='dashed', linewidth=2, markersize=12, label="Drone Moves")
+            self._horz_error, = ax.plot([], [], alpha=.15)
+            self._horz_flips, = ax.plot([], [], 'ro', markersize=12, label="Drone Flips")
+            ax.xaxis.set_major_locator(MaxNLocator(integer=True))
+            ax.grid()
+            ax.legend()
+            ax.set(xlabel='X Distance from Takeoff', ylabel='Y Distance from Takeoff')
+            self._horz_ax = ax
+            self._horz_limits = None
+            self._interactive_shown = False
+        return self._horz_ax
+
+    def _show_plots(self):
+        if not self._interactive_shown:
+            plt.show(block=False)
+            self._interactive_shown = True
+
     def plot_altitude_steps(self, e):
-        fig, ax = plt.subplots()
-        ax.xaxis.set_major_locator(MaxNLocator(integer=True))
-        ax.plot(self.altitude_data,'ro', linestyle='dashed', linewidth=2, markersize=12)
-        ax.plot(self.altitude_data, linewidth=e, alpha=.15)
-        ax.grid()
-        ax.set(xlabel='Step', ylabel='Altitude in Centimeters',title='Tello Altitude')
-        plt.show()
+        if self._suppress_plot:
+            return
+        ax = self._get_altitude_axes()
+        steps = np.arange(self._alt_len)
+        self._alt_moves.set_data(steps, self.altitude_data)
+        self._alt_error.set_data(steps, self.altitude_data)
+        self._alt_error.set_linewidth(e)
+        ax.relim()
+        ax.autoscale_view()
+        self._alt_fig.canvas.draw_idle()
+        self._show_plots()
 
     def plot_horz_steps(self, e):
-        title = "Path of Tello from Takeoff Location. \nLast Heading= {} Degrees from Start".format(self.bearing)
-        fig, ax = plt.subplots()
-        horz_df = pd.DataFrame(self.path_coors)
-        xlow = min(horz_df[0])
-        xhi = max(horz_df[0])
-        ylow = min(horz_df[1])
-        yhi = max(horz_df[1])
+        if self._suppress_plot:
+            return
+        title = f"Path of Tello from Takeoff Location. \nLast Heading= {self.bearing} Degrees from Start"
+        ax = self._get_horz_axes()
+        xlow = self._xmin
+        xhi = self._xmax
+        ylow = self._ymin
+        yhi = self._ymax
         xlowlim = -200 if xlow > -200 else xlow - 40
         xhilim = 200 if xhi < 200 else xhi + 40
         ylowlim = -200 if ylow > -200 else ylow - 40
         yhilim = 200 if yhi < 200 else yhi + 40
-        ax.set_xlim([xlowlim, xhilim])
-        ax.set_ylim([ylowlim, yhilim])
-        ax.plot(horz_df[0], horz_df[1], 'bo', linestyle='dashed', linewidth=2, markersize=12, label="Drone Moves")
-        ax.plot(horz_df[0], horz_df[1], linewidth=e, alpha=.15)
-        if len(self.flip_coors) > 0:
-            flip_df = pd.DataFrame(self.flip_coors)
-            ax.plot(flip_df[0], flip_df[1], 'ro', markersize=12, label="Drone Flips")
-        ax.xaxis.set_major_locator(MaxNLocator(integer=True))
-        ax.grid()
-        ax.legend()
-        ax.set(xlabel='X Distance from Takeoff', ylabel='Y Distance from Takeoff',title=title)
-        plt.show()
+        limits = ((xlowlim, xhilim), (ylowlim, yhilim))
+        # Setting limits relayouts the axes, so only do it when they change
+        if limits != self._horz_limits:
+            ax.set_xlim(limits[0])
+            ax.set_ylim(limits[1])
+            self._horz_limits = limits
+        self._horz_moves.set_data(self._px, self._py)
+        self._horz_error.set_data(self._px, self._py)
+        self._horz_error.set_linewidth(e)
+        self._horz_flips.set_data(self._flip_x, self._flip_y)
+        ax.set_title(title)
+        self._horz_fig.canvas.draw_idle()
+        self._show_plots()
+
+    def _plot_flight(self, e):
+        self.plot_horz_steps(e)
+        self.plot_altitude_steps(e)
+        if not self._suppress_plot and not plt.isinteractive():
+            # Scripts have no running GUI event loop, so block here to
+            # actually show the finished graphs
+            plt.show()
+
+    def _on_state_change(self):
+        # Step plots are only drawn for moves, so there is nothing to update
+        pass
 
     # Determine bearing relative to start which is inline with positive y-axis
     @staticmethod
     def dist_bearing(orig, bearing, dist):
-        rads = np.deg2rad(bearing)
-        sines = np.sin(rads)
-        coses = np.cos(rads)
-        dx = sines * dist
-        dy = coses * dist
-        x_n = np.cumsum(dx) + orig[0]
-        y_n = np.cumsum(dy) + orig[1]
-        return x_n[0], y_n[0]
+        return step_move(orig[0], orig[1], bearing, 1, dist)
 
    # Movement Commands
     def takeoff(self):
         """Command drone to takeoff."""
         if not self.takeoff_state:
-            print("Get ready for takeoff!")
+            self._log("Get ready for takeoff!")
             self.takeoff_state = True
             # Add initial altitude of 0 before takeoff
-            self.altitude_data.append(0)  
+            self._append_altitude(0)
             self.altitude = self.takeoff_alt
-            self.altitude_data.append(self.takeoff_alt)
+            self._append_altitude(self.takeoff_alt)
             self.send_command('takeoff')
-            print("My estimated takeoff altitude is {} centimeters".format(self.altitude))
-            # Update plot for realtime simulator
-            if isinstance(self, RealtimeSimulator):
-                self.update_plot()
+            self._log(f"My estimated takeoff altitude is {self.altitude} centimeters")
+            self._on_state_change()
         else:
-            print("My current altitude is {} centimeters, so I can't takeoff again!".format(self.altitude))
+            self._log(f"My current altitude is {self.altitude} centimeters, so I can't takeoff again!")
 
     def land(self, e=25):
         """Command drone to land."""
         self.check_takeoff()
-        print("Get ready for landing!")
+        self._log("Get ready for landing!")
         self.takeoff_state = False
         # Add final altitude of 0 after landing
         self.altitude = 0
-        self.altitude_data.append(0)  
+        self._append_altitude(0)
         self.send_command('land')
-        print("Here are the graphs of your flight! I can't wait to try this for real.")
-        
-        # Update plot for realtime simulator
-        if isinstance(self, RealtimeSimulator):
-            self.update_plot()
-        else:
-            self.plot_horz_steps(e)
-            self.plot_altitude_steps(e)
+        self._log("Here are the graphs of your flight! I can't wait to try this for real.")
+        self._plot_flight(e)
 
     def up(self, dist: int, e=25):
         """
@@ -176,9 +346,11 @@ class Simulator():
         self.check_takeoff()
         self.check_int_param(dist)
         self.check_int_param(e)
-        print("My current bearing is {} degrees.".format(self.bearing))
+        self._log(f"My current bearing is {self.bearing} degrees.")
+        # Record the sample first so an out-of-range altitude leaves the
+        # state untouched
+        self._append_altitude(self.altitude + dist)
         self.altitude = self.altitude + dist
-        self.altitude_data.append(self.altitude)
         self.send_command('up', dist)
         self.plot_altitude_steps(e)
 
@@ -201,9 +373,11 @@ class Simulator():
         self.check_takeoff()
         self.check_int_param(dist)
         self.check_int_param(e)
-        print("My current bearing is {} degrees.".format(self.bearing))
+        self._log(f"My current bearing is {self.bearing} degrees.")
+        # Record the sample first so an out-of-range altitude leaves the
+        # state untouched
+        self._append_altitude(self.altitude - dist)
         self.altitude = self.altitude - dist
-        self.altitude_data.append(self.altitude)
         self.send_command('down', dist)
         self.plot_altitude_steps(e)
 
@@ -226,11 +400,10 @@ class Simulator():
         self.check_takeoff()
         self.check_int_param(dist)
         self.check_int_param(e)
-        print("My current bearing is {} degrees.".format(self.bearing))
-        new_loc = self.dist_bearing(orig=self.cur_loc, bearing=self.bearing-90, dist=dist)
+        self._log(f"My current bearing is {self.bearing} degrees.")
+        new_loc = step_move(self.cur_loc[0], self.cur_loc[1], self.bearing-90, 1, dist)
         self.cur_loc = new_loc
-        self.path_coors.append(new_loc)
-        print(self.path_coors)
+        self._append_path(new_loc)
         self.send_command('left', dist)
         self.plot_horz_steps(e)
 
@@ -253,10 +426,10 @@ class Simulator():
         self.check_takeoff()
         self.check_int_param(dist)
         self.check_int_param(e)
-        print("My current bearing is {} degrees.".format(self.bearing))
-        new_loc = self.dist_bearing(orig=self.cur_loc, bearing=self.bearing+90, dist=dist)
+        self._log(f"My current bearing is {self.bearing} degrees.")
+        new_loc = step_move(self.cur_loc[0], self.cur_loc[1], self.bearing+90, 1, dist)
         self.cur_loc = new_loc
-        self.path_coors.append(new_loc)
+        self._append_path(new_loc)
         self.send_command('right', dist)
         self.plot_horz_steps(e)
 
@@ -279,10 +452,10 @@ class Simulator():
         self.check_takeoff()
         self.check_int_param(dist)
         self.check_int_param(e)
-        print("My current bearing is {} degrees.".format(self.bearing))
-        new_loc = self.dist_bearing(orig=self.cur_loc, bearing=self.bearing, dist=dist)
+        self._log(f"My current bearing is {self.bearing} degrees.")
+        new_loc = step_move(self.cur_loc[0], self.cur_loc[1], self.bearing, 1, dist)
         self.cur_loc = new_loc
-        self.path_coors.append(new_loc)
+        self._append_path(new_loc)
         self.send_command('forward', dist)
         self.plot_horz_steps(e)
 
@@ -305,9 +478,9 @@ class Simulator():
         self.check_takeoff()
         self.check_int_param(dist)
         self.check_int_param(e)
-        new_loc = self.dist_bearing(orig=self.cur_loc, bearing=self.bearing+180, dist=dist)
+        new_loc = step_move(self.cur_loc[0], self.cur_loc[1], self.bearing+180, 1, dist)
         self.cur_loc = new_loc
-        self.path_coors.append(new_loc)
+        self._append_path(new_loc)
         self.send_command('back', dist)
         self.plot_horz_steps(e)
 
@@ -326,10 +499,10 @@ class Simulator():
         """
         self.check_takeoff()
         self.check_int_param(degr)
-        print("My current bearing is {} degrees.".format(self.bearing))
+        self._log(f"My current bearing is {self.bearing} degrees.")
         self.bearing = (self.bearing + (degr % 360)) % 360
         self.send_command('cw', degr)
-        print("My new bearing is {} degrees.".format(self.bearing))
+        self._log(f"My new bearing is {self.bearing} degrees.")
 
     def ccw(self, degr: int):
         """
@@ -346,10 +519,10 @@ class Simulator():
         """
         self.check_takeoff()
         self.check_int_param(degr)
-        print("My current bearing is {} degrees.".format(self.bearing))
+        self._log(f"My current bearing is {self.bearing} degrees.")
         self.bearing = (self.bearing - (degr % 360)) % 360
         self.send_command('ccw', degr)
-        print("My current bearing is {} degrees.".format(self.bearing))
+        self._log(f"My current bearing is {self.bearing} degrees.")
 
     def flip(self, direc: str, e=25):
         """
@@ -375,7 +548,9 @@ class Simulator():
         self.check_flip_param(direc)
         self.check_int_param(e)
         self.send_command('flip', direc)
-        self.flip_coors.append(self.cur_loc)
+        self._flip_x.append(self.cur_loc[0])
+        self._flip_y.append(self.cur_loc[1])
+        self._flip_dirty = True
         self.plot_horz_steps(e)
 
     # Deploys the command log from the simulation state to the actual drone
@@ -396,8 +571,11 @@ class Simulator():
             # keep a single driver instance open per session
             self.driver_instance = Tello()
 
-        for command in self.command_log:
-            self.driver_instance.send_command(self.serialize_command(command))
+        # The drone has to be put into command mode before anything else
+        if len(self.command_log) == 0 or self.command_log[0][0] != 'command':
+            self.driver_instance.send_command(_serialize('command'))
+        for command, args in self.command_log:
+            self.driver_instance.send_command(_serialize(command, *args))
 
     # Resets the simulation state back to the beginning: no commands + landed
     def reset(self):
@@ -411,7 +589,8 @@ class Simulator():
         """
         print('Resetting simulator state...')
         self._init_state()
-        self.command()
+        if self.driver_instance is not None:
+            self.command()
 
     def save(self, file_path='commands.json'):
         """
@@ -426,9 +605,21 @@ class Simulator():
         drone.save("commands.json") # save current state to JSON file
 
         """
-        print('Saving commands to {}'.format(file_path))
-        with open(file_path, 'w') as json_file:
-            json.dump(self.command_log, json_file, indent=4)
+        print(f'Saving commands to {file_path}')
+        command_log = [{'command': command, 'arguments': args} for command, args in self.command_log]
+        encoded = None
+        if orjson is not None:
+            try:
+                encoded = orjson.dumps(command_log, option=orjson.OPT_INDENT_2)
+            except orjson.JSONEncodeError:
+                # e.g. integers beyond 64 bits, which the json module handles
+                encoded = None
+        if encoded is not None:
+            with open(file_path, 'wb') as json_file:
+                json_file.write(encoded)
+        else:
+            with open(file_path, 'w') as json_file:
+                json.dump(command_log, json_file, indent=4)
 
     def load_commands(self, file_path:str):
         """
@@ -445,20 +636,41 @@ class Simulator():
 
         """
         self._init_state()
-        print('Loading commands from {}'.format(file_path))
-        with open(file_path) as json_file:
-            commands = json.load(json_file)
-
-        for command in commands:
-            # TODO guard checks
-            getattr(self, command['command'])(*command['arguments'])
+        print(f'Loading commands from {file_path}')
+        if orjson is not None:
+            with open(file_path, 'rb') as json_file:
+                commands = orjson.loads(json_file.read())
+        else:
+            with open(file_path) as json_file:
+                commands = json.load(json_file)
+
+        # Replay without drawing each step, then draw the whole flight once
+        self._suppress_plot = True
+        self._batch_mode = True
+        try:
+            # One command at a time: fusing runs of moves into a single
+            # np.cumsum measured slower than step_move for runs of 2 to 1000
+            for command in commands:
+                # TODO guard checks
+                getattr(self, command['command'])(*command['arguments'])
+        finally:
+            self._suppress_plot = False
+            self._batch_mode = False
+            self._flush_log()
+        if len(commands) > 0:
+            self._plot_flight(25)
 
     def get_smoothed_altitude(self):
         """Apply simple moving average to altitude data"""
         if len(self.altitude_data) < self.smoothing_window:
             return self.altitude_data
-        return pd.Series(self.altitude_data).rolling(
-            window=self.smoothing_window, center=True).mean()
+        if self._sma_window.maxlen != self.smoothing_window:
+            # The window was changed after construction; rebuild the average
+            self._reset_sma()
+            for height in self.altitude_data.tolist():
+                self._update_sma(height)
+        # The trailing points have no full window centered on them yet
+        return self._sma_out + [float('nan')] * ((self.smoothing_window - 1) // 2)
 
 class RealtimeSimulator(Simulator):
     def __init__(self):
@@ -476,8 +688,8 @@ class RealtimeSimulator(Simulator):
         self.ax1.set_xlabel('X Distance from Takeoff')
         self.ax1.set_ylabel('Y Distance from Takeoff')
         # Plot initial point at (0,0)
-        self.path_line, = self.ax1.plot([0], [0], 'bo-', label="Drone Moves")
-        self.flip_points, = self.ax1.plot([], [], 'ro', markersize=12, label="Drone Flips")
+        self.path_line, = self.ax1.plot([0], [0], 'bo-', label="Drone Moves", animated=True)
+        self.flip_points, = self.ax1.plot([], [], 'ro', markersize=12, label="Drone Flips", animated=True)
         self.ax1.legend()
         
         # Altitude plot
@@ -485,11 +697,20 @@ class RealtimeSimulator(Simulator):
         self.ax2.grid(True)
         self.ax2.set_xlabel('Step')
         self.ax2.set_ylabel('Altitude in Centimeters')
+        self.ax2.set_title("Tello Altitude")
         # Set initial altitude plot limits
         self.ax2.set_xlim([-0.5, 10])  # Show range for first few points
         self.ax2.set_ylim([0, 100])    # Show reasonable altitude range
-        self.altitude_line, = self.ax2.plot([0], [0], 'ro-', label="Altitude")
+        self.altitude_line, = self.ax2.plot([0], [0], 'ro-', label="Altitude", animated=True)
         self.ax2.legend()
+
+        # Backgrounds (axes without the animated lines) used for blitting.
+        # They are refreshed on every full draw, e.g. after a limit change.
+        self._bg1 = None
+        self._bg2 = None
+        self._path_limits = None
+        self._alt_limits = None
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
         
         # Update the layout and show
         plt.tight_layout()
@@ -497,38 +718,83 @@ class RealtimeSimulator(Simulator):
         self.fig.canvas.flush_events()
         plt.show(block=False)
 
+    def _on_draw(self, event):
+        """Cache the static backgrounds and draw the animated artists on top"""
+        if event is not None and event.canvas != self.fig.canvas:
+            return
+        if getattr(self.fig.canvas, 'supports_blit', False):
+            self._bg1 = self.fig.canvas.copy_from_bbox(self.ax1.bbox)
+            self._bg2 = self.fig.canvas.copy_from_bbox(self.ax2.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        self.ax1.draw_artist(self.path_line)
+        self.ax1.draw_artist(self.flip_points)
+        self.ax2.draw_artist(self.altitude_line)
+
     def update_plot(self):
+        if self._suppress_plot:
+            return
+        # Only hand matplotlib the series that changed
+        path_changed = self._path_dirty or self._flip_dirty
+        alt_changed = self._alt_dirty
+
         # Update path plot
-        if len(self.path_coors) > 0:
-            df = pd.DataFrame(self.path_coors)
-            self.path_line.set_data(df[0], df[1])
-            # Update path plot limits if needed
-            xmin, xmax = min(df[0]), max(df[0])
-            ymin, ymax = min(df[1]), max(df[1])
-            self.ax1.set_xlim([min(-200, xmin-20), max(200, xmax+20)])
-            self.ax1.set_ylim([min(-200, ymin-20), max(200, ymax+20)])
+        if self._path_dirty:
+            self.path_line.set_data(self._px, self._py)
+            self._path_dirty = False
+        path_xlim = (min(-200, self._xmin-20), max(200, self._xmax+20))
+        path_ylim = (min(-200, self._ymin-20), max(200, self._ymax+20))
         
         # Update flip points
-        if len(self.flip_coors) > 0:
-            df = pd.DataFrame(self.flip_coors)
-            self.flip_points.set_data(df[0], df[1])
+        if self._flip_dirty:
+            self.flip_points.set_data(self._flip_x, self._flip_y)
+            self._flip_dirty = False
         
         # Update altitude plot
-        if len(self.altitude_data) > 0:
-            x = range(len(self.altitude_data))
-            self.altitude_line.set_data(x, self.altitude_data)
-            # Update altitude plot limits
-            self.ax2.set_xlim(-0.5, len(self.altitude_data) - 0.5)
-            ymin = min(0, min(self.altitude_data))
-            ymax = max(100, max(self.altitude_data) * 1.1)
-            self.ax2.set_ylim(ymin, ymax)
-        
-        # Update titles
-        self.ax1.set_title(f"Path of Tello from Takeoff Location.\nLast Heading= {self.bearing} Degrees from Start")
-        self.ax2.set_title("Tello Altitude")
-        
-        # Redraw
-        self.fig.canvas.draw()
+        alt_limits = self._alt_limits
+        if self._alt_dirty:
+            alt = self.altitude_data
+            self.altitude_line.set_data(np.arange(self._alt_len), alt)
+            self._alt_dirty = False
+            if self._alt_len > 0:
+                # Grow the axes in steps of 10 moves and 50 centimeters so
+                # most updates leave the limits alone and can be blitted
+                alt_xlim = (-0.5, max(10, 10 * math.ceil(self._alt_len / 10)))
+                alt_ylim = (min(0, int(alt.min())), max(100, 50 * math.ceil(int(alt.max()) * 1.1 / 50)))
+                alt_limits = (alt_xlim, alt_ylim)
+
+        # Changing limits or the title invalidates the cached backgrounds
+        path_limits = (path_xlim, path_ylim)
+        if path_limits != self._path_limits:
+            self.ax1.set_xlim(path_xlim)
+            self.ax1.set_ylim(path_ylim)
+            self._path_limits = path_limits
+            self._bg1 = None
+        if alt_limits != self._alt_limits:
+            self.ax2.set_xlim(alt_limits[0])
+            self.ax2.set_ylim(alt_limits[1])
+            self._alt_limits = alt_limits
+            self._bg2 = None
+        title = f"Path of Tello from Takeoff Location.\nLast Heading= {self.bearing} Degrees from Start"
+        if title != self.ax1.get_title():
+            self.ax1.set_title(title)
+            self._bg1 = None
+
+        if self._bg1 is None or self._bg2 is None:
+            # Full redraw; the draw_event handler refreshes the backgrounds
+            self.fig.canvas.draw()
+        else:
+            # Only the lines changed: blit them over the cached backgrounds
+            if path_changed:
+                self.fig.canvas.restore_region(self._bg1)
+                self.ax1.draw_artist(self.path_line)
+                self.ax1.draw_artist(self.flip_points)
+                self.fig.canvas.blit(self.ax1.bbox)
+            if alt_changed:
+                self.fig.canvas.restore_region(self._bg2)
+                self.ax2.draw_artist(self.altitude_line)
+                self.fig.canvas.blit(self.ax2.bbox)
         self.fig.canvas.flush_events()
     
     def plot_horz_steps(self, e):
@@ -538,6 +804,12 @@ class RealtimeSimulator(Simulator):
     def plot_altitude_steps(self, e):
         # Override parent method to prevent creating new plots
         self.update_plot()
+
+    def _plot_flight(self, e):
+        self.update_plot()
+
+    def _on_state_change(self):
+        self.update_plot()
     
     def update_status(self):
         """Update status text on plots"""